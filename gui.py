@@ -1,15 +1,16 @@
-import tkinter as tk
-from PIL import Image, ImageTk
-from game_logic import Solitaire
-from tkinter import Button
+import time
+from solitaire import Solitaire, profiled, profiler
 
 
 class SolitaireGUI:
-    def __init__(self, root):
+    def __init__(self, root, game_factory=Solitaire):
+        import tkinter as tk
+
         self.root = root
         self.root.title("Solitaire")
 
-        self.game = Solitaire()
+        self.game_factory = game_factory
+        self.game = self.game_factory()
         self.selected_stack = None
         self.selected_card_index = None
 
@@ -33,6 +34,8 @@ class SolitaireGUI:
 
     def load_card_images(self):
         """Incarca si redimensioneaza imaginile cartilor din fisiere. Returneaza un dictionar cu imaginile cartilor."""
+        from PIL import Image, ImageTk
+
         images = {}
         suits = ["hearts", "diamonds", "clubs", "spades"]
         for suit in suits:
@@ -53,7 +56,10 @@ class SolitaireGUI:
     
     def setup_ui(self):
         """Configureaza butoanele de interfata pentru resetarea jocului si pentru setarea unei stari aproape castigatoare."""
-        self.canvas.bind("<Button-1>", self.on_click)
+        from tkinter import Button
+
+        self.canvas.bind("<Button-1>", self.handle_click)
+        self.root.bind("<F12>", self.toggle_profiling)
 
         button_width = 12
         button_height = 2
@@ -87,21 +93,39 @@ class SolitaireGUI:
 
     def reset_to_almost_win(self):
         """Seteaza jocul intr-o stare aproape castigatoare. Reseteaza numarul de mutari si redeseneaza jocul."""
-        self.game.setup_almost_win_state()
+        try:
+            self.game.setup_almost_win_state()
+        except (ValueError, OSError) as e:
+            print(f"Almost win error: {e}")
+            return
         self.move_count = 0
         self.draw_game()
         print("Game set to an almost-win state.")
 
     def reset_game(self):
         """Reseteaza jocul la starea initiala, creand o instanta noua a jocului si actualizand interfata."""
-        self.game = Solitaire()
+        try:
+            self.game = self.game_factory()
+        except (ValueError, OSError) as e:
+            print(f"Reset error: {e}")
+            return
         self.selected_stack = None
         self.selected_card_index = None
         self.move_count = 0
         self.draw_game()
         print("Game has been reset.")
 
-    
+    def toggle_profiling(self, event=None):
+        """Porneste sau opreste profilarea in mod esantionat (tasta ascunsa F12). La oprire exporta statisticile."""
+        if profiler.enabled:
+            profiler.disable()
+            path = profiler.export()
+            print(f"Profiling stopped. Stats written to {path}.")
+        else:
+            profiler.enable(sample_every=10)
+            print("Profiling started (sampling mode).")
+
+    @profiled("gui.draw_game")
     def draw_game(self):
         """Deseneaza starea curenta a jocului pe canvas, incluzand stivele de carti si mesajele relevante."""
         self.canvas.delete("all")
@@ -148,6 +172,8 @@ class SolitaireGUI:
 
     def draw_empty_stock_button(self, x, y):
         """Deseneaza un buton pentru reciclarea stivei Stock atunci cand aceasta este goala."""
+        from tkinter import Button
+
         button = Button(
             self.root,
             text="Recycle Stock",
@@ -165,7 +191,7 @@ class SolitaireGUI:
         try:
             self.game.recycle_stock()
             self.draw_game()
-        except ValueError as e:
+        except (ValueError, OSError) as e:
             print(f"Recycle error: {e}")
 
     def draw_pile(self, cards, x, y, label, hidden=False):
@@ -274,13 +300,25 @@ class SolitaireGUI:
         )
         return None
 
+    def handle_click(self, event):
+        """Trateaza click-ul si, daca profilarea este activa, masoara latenta pana la redesenarea canvas-ului."""
+        if not profiler.enabled:
+            self.on_click(event)
+            return
+        started = time.perf_counter()
+        self.on_click(event)
+        self.root.after_idle(profiler.record_since, "gui.on_click.latency", started)
+
     def on_click(self, event):
         """Gestioneaza interactiunea cu click-urile"""
         stack = self.get_stack_at_position(event.x, event.y)
         if stack:
             if stack == "Stock":
                 print("Clicked on Stock. Drawing card to Waste.")
-                self.game.draw_from_stock()
+                try:
+                    self.game.draw_from_stock()
+                except (ValueError, OSError) as e:
+                    print(f"Move error: {e}")
                 self.draw_game()
                 return
 
@@ -345,24 +383,40 @@ class SolitaireGUI:
                 card = self.game.tableau[tableau_index].peek()
                 if card:
                     print(f"Moving card {card} to a Foundation")
-                    for i, foundation in enumerate(self.game.foundation):
-                        if foundation.can_add_card(card):
-                            foundation.add_card(
-                                self.game.tableau[tableau_index].remove_card()
-                            )
-                            self.game.tableau[tableau_index].reveal_card()
-                            self.move_count += 1
-                            break
+                    if self.game.move_to_foundation(tableau_index):
+                        self.move_count += 1
             elif "Waste" in from_stack and "Foundation" in to_stack:
                 print("Attempting to move card from Waste to Foundation")
                 self.game.move_from_waste_to_foundation()
                 self.move_count += 1
             else:
                 print("Invalid move")
-        except ValueError as e:
+        except (ValueError, OSError) as e:
             print(f"Move error: {e}")
 
 if __name__ == "__main__":
+    import argparse
+    import logging
+    import sys
+    import tkinter as tk
+    from functools import partial
+
+    parser = argparse.ArgumentParser(description="Solitaire")
+    parser.add_argument(
+        "--server", help='play against a game server ("host:port" or "unix:/path")'
+    )
+    args = parser.parse_args()
+    engine_logger = logging.getLogger("solitaire")
+    engine_logger.addHandler(logging.StreamHandler(sys.stdout))
+    engine_logger.setLevel(logging.DEBUG)
+
+    game_factory = Solitaire
+    if args.server:
+        from solitaire.client import Connection, RemoteSolitaire
+
+        connection = Connection(args.server)
+        game_factory = partial(RemoteSolitaire, connection)
+
     root = tk.Tk()
-    app = SolitaireGUI(root)
+    app = SolitaireGUI(root, game_factory)
     root.mainloop()
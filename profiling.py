@@ -0,0 +1,3 @@
+"""Pastrat pentru compatibilitate; profilarea se afla in `solitaire.profiling`."""
+
+from solitaire.profiling import Profiler, profiled, profiler
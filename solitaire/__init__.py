@@ -0,0 +1,17 @@
+"""Motorul jocului Solitaire, fara dependente de GUI (tkinter, Pillow)."""
+
+from solitaire.game_logic import Card, Deck, Foundation, Pile, Solitaire, Stock, Tableau
+from solitaire.profiling import Profiler, profiled, profiler
+
+__all__ = [
+    "Card",
+    "Deck",
+    "Foundation",
+    "Pile",
+    "Profiler",
+    "Solitaire",
+    "Stock",
+    "Tableau",
+    "profiled",
+    "profiler",
+]
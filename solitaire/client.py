@@ -0,0 +1,143 @@
+"""Client sincron pentru serverul de joc, folosit de GUI in modul thin client."""
+
+import json
+import socket
+
+from solitaire.game_logic import Foundation, Pile, Stock, Tableau
+from solitaire.protocol import HIDDEN, apply_delta, decode_card
+
+
+class Connection:
+    def __init__(self, address, timeout=5.0):
+        """Se conecteaza la server. Adresa este "host:port" sau "unix:/cale/socket".
+
+        Daca serverul nu raspunde in `timeout` secunde, operatia ridica TimeoutError.
+        """
+        if address.startswith("unix:"):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(address[5:])
+        else:
+            host, _, port = address.rpartition(":")
+            self.sock = socket.create_connection((host or "127.0.0.1", int(port)), timeout)
+        self.stream = self.sock.makefile("rb")
+
+    def send(self, command):
+        """Trimite o comanda si returneaza raspunsul decodificat.
+
+        Dupa o eroare de retea conexiunea este inchisa, deoarece raspunsurile nu mai pot fi
+        asociate comenzilor.
+        """
+        try:
+            self.sock.sendall(command.encode() + b"\n")
+            line = self.stream.readline()
+            if not line:
+                raise ConnectionError("Server closed the connection")
+        except OSError:
+            self.close()
+            raise
+        return json.loads(line)
+
+    def close(self):
+        """Inchide conexiunea cu serverul."""
+        self.stream.close()
+        self.sock.close()
+
+
+class RemoteSolitaire:
+    """Oglinda locala a unui joc gazduit pe server, cu aceeasi interfata ca Solitaire.
+
+    Mutarile sunt validate de server; local se aplica doar diferentele primite.
+    """
+
+    def __init__(self, connection, session_id=None):
+        self.connection = connection
+        self.session_id = session_id
+        self.state = {}
+        self.won = False
+        self.stock = Stock()
+        self.waste = Pile()
+        self.tableau = []
+        self.foundation = []
+        self.send("join " + session_id if session_id else "new")
+
+    def send(self, command):
+        """Trimite o comanda, actualizeaza starea locala si ridica ValueError daca mutarea este invalida."""
+        response = self.connection.send(command)
+        if "session" in response:
+            self.session_id = response["session"]
+        if "d" in response:
+            apply_delta(self.state, response["d"])
+            self.won = response["won"]
+            self.rebuild()
+        if not response["ok"]:
+            raise ValueError(response["error"])
+        return response
+
+    def rebuild(self):
+        """Reconstruieste stivele locale din starea primita de la server."""
+        self.stock.cards = [decode_card(code) for code in self.state["s"]]
+        self.waste.cards = [decode_card(code) for code in self.state["w"]]
+
+        self.tableau = []
+        while f"t{len(self.tableau)}" in self.state:
+            codes = self.state[f"t{len(self.tableau)}"]
+            tableau = Tableau()
+            tableau.cards = [decode_card(code) for code in codes]
+            tableau.face_up_cards = len(codes) - codes.count(HIDDEN)
+            self.tableau.append(tableau)
+
+        self.foundation = []
+        for i, suit in enumerate(self.state["fs"]):
+            foundation = Foundation(suit)
+            foundation.cards = [decode_card(code) for code in self.state[f"f{i}"]]
+            self.foundation.append(foundation)
+
+    def draw_from_stock(self):
+        """Trage o carte din stiva Stock in Waste."""
+        self.send("d")
+        return self.waste.peek()
+
+    def move_from_waste_to_tableau(self, tableau_index):
+        """Muta o carte din Waste pe o stiva Tableau."""
+        self.send(f"wt{tableau_index}")
+        return True
+
+    def move_from_waste_to_foundation(self):
+        """Muta o carte din Waste intr-o stiva Foundation."""
+        self.send("wf")
+        return True
+
+    def recycle_stock(self):
+        """Reumple Stock cu cartile din Waste."""
+        self.send("r")
+
+    def setup_almost_win_state(self):
+        """Configureaza jocul intr-o stare aproape castigatoare."""
+        self.send("aw")
+
+    def move_to_foundation(self, tableau_index):
+        """Muta o carte din Tableau intr-un Foundation."""
+        try:
+            self.send(f"tf{tableau_index}")
+        except ValueError:
+            return False
+        return True
+
+    def move_within_tableau(self, from_index, to_index, start_card_index):
+        """Mută o secvență de cărți de la un Tableau la altul."""
+        self.send(f"tt{from_index},{to_index},{start_card_index}")
+
+    def move_from_stock_to_tableau(self, tableau_index):
+        """Muta o carte din Stock pe un Tableau."""
+        self.send(f"st{tableau_index}")
+        return True
+
+    def move_from_stock_to_foundation(self):
+        """Muta o carte din Stock intr-un Foundation."""
+        self.send("sf")
+        return True
+
+    def check_win(self):
+        """Verifica daca jocul este castigat."""
+        return self.won
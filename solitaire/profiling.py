@@ -0,0 +1,158 @@
+import atexit
+import json
+import logging
+import os
+import time
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+
+class Profiler:
+    """Colecteaza contoare de apeluri si timpi cumulati pentru metodele instrumentate.
+
+    Profilarea este dezactivata implicit si se activeaza prin variabila de mediu
+    SOLITAIRE_PROFILE sau din GUI (tasta F12):
+      SOLITAIRE_PROFILE=1          - masoara fiecare apel
+      SOLITAIRE_PROFILE=sample     - masoara doar un apel din SOLITAIRE_PROFILE_SAMPLE (implicit 10)
+      SOLITAIRE_PROFILE_FILE=path  - fisierul de export (.prom pentru formatul Prometheus, altfel JSON)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_every = 1
+        self.output_path = "solitaire_stats.json"
+        self.export_registered = False
+        self.reset()
+
+    def reset(self):
+        """Sterge toate statisticile colectate."""
+        self.calls = {}
+        self.sampled = {}
+        self.total_time = {}
+        self.max_time = {}
+
+    def configure_from_env(self, environ=None):
+        """Citeste configuratia din variabilele de mediu si activeaza profilarea daca este ceruta."""
+        environ = os.environ if environ is None else environ
+        mode = environ.get("SOLITAIRE_PROFILE", "").strip().lower()
+        self.output_path = environ.get("SOLITAIRE_PROFILE_FILE", self.output_path)
+        if mode in ("", "0", "off", "false"):
+            return
+        sample_every = 1
+        if mode == "sample":
+            value = environ.get("SOLITAIRE_PROFILE_SAMPLE", "10")
+            try:
+                sample_every = int(value)
+            except ValueError:
+                sample_every = 0
+            if sample_every < 1:
+                logger.warning("Invalid SOLITAIRE_PROFILE_SAMPLE=%r, using 10", value)
+                sample_every = 10
+        self.enable(sample_every)
+
+    def enable(self, sample_every=1):
+        """Porneste profilarea. Doar un apel din `sample_every` este cronometrat."""
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        self.sample_every = sample_every
+        self.enabled = True
+        if not self.export_registered:
+            atexit.register(self.export)
+            self.export_registered = True
+
+    def disable(self):
+        """Opreste profilarea fara a sterge statisticile colectate."""
+        self.enabled = False
+
+    def call(self, name, func, args, kwargs):
+        """Apeleaza functia, numarand apelul si cronometrandu-l daca este esantionat."""
+        count = self.calls.get(name, 0) + 1
+        self.calls[name] = count
+        if count % self.sample_every:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.add_timing(name, time.perf_counter() - started)
+
+    def add_timing(self, name, elapsed):
+        """Adauga o durata masurata (in secunde) la statisticile unui nume."""
+        self.sampled[name] = self.sampled.get(name, 0) + 1
+        self.total_time[name] = self.total_time.get(name, 0.0) + elapsed
+        if elapsed > self.max_time.get(name, 0.0):
+            self.max_time[name] = elapsed
+
+    def record_since(self, name, started):
+        """Inregistreaza o durata masurata de la momentul `started` (time.perf_counter)."""
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.add_timing(name, time.perf_counter() - started)
+
+    def snapshot(self):
+        """Returneaza statisticile curente sub forma unui dictionar serializabil."""
+        stats = {}
+        for name in sorted(self.calls):
+            sampled = self.sampled.get(name, 0)
+            total = self.total_time.get(name, 0.0)
+            stats[name] = {
+                "calls": self.calls[name],
+                "sampled_calls": sampled,
+                "total_seconds": total,
+                "mean_seconds": total / sampled if sampled else 0.0,
+                "max_seconds": self.max_time.get(name, 0.0),
+            }
+        return {"sample_every": self.sample_every, "stats": stats}
+
+    def to_json(self):
+        """Exporta statisticile in format JSON."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        """Exporta statisticile in formatul text Prometheus."""
+        metrics = [
+            ("solitaire_calls_total", "counter", "Number of calls.", "calls"),
+            ("solitaire_sampled_calls_total", "counter", "Number of timed calls.", "sampled_calls"),
+            ("solitaire_seconds_total", "counter", "Cumulative time of timed calls.", "total_seconds"),
+            ("solitaire_seconds_max", "gauge", "Slowest timed call.", "max_seconds"),
+        ]
+        stats = self.snapshot()["stats"]
+        lines = []
+        for metric, kind, help_text, key in metrics:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, values in stats.items():
+                lines.append(f'{metric}{{name="{name}"}} {values[key]}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path=None):
+        """Scrie statisticile intr-un fisier local. Formatul este ales dupa extensie."""
+        path = path or self.output_path
+        if path.endswith(".prom"):
+            content = self.to_prometheus()
+        else:
+            content = self.to_json()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        return path
+
+
+profiler = Profiler()
+profiler.configure_from_env()
+
+
+def profiled(name):
+    """Decorator care numara si cronometreaza apelurile cand profilarea este activa."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            return profiler.call(name, func, args, kwargs)
+
+        return wrapper
+
+    return decorator
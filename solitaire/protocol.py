@@ -0,0 +1,127 @@
+"""Protocolul compact folosit intre serverul de joc si clienti.
+
+Clientul trimite cate o comanda pe linie:
+  new                 - incepe un joc nou
+  join <session>      - se ataseaza la un joc existent
+  d / r               - trage o carte din Stock / recicleaza Stock
+  wt<i> / wf          - Waste -> Tableau i / Foundation
+  st<i> / sf          - Stock -> Tableau i / Foundation
+  tf<i>               - Tableau i -> Foundation
+  tt<from>,<to>,<k>   - muta cartile din Tableau `from` incepand cu indexul k pe Tableau `to`
+  aw                  - starea aproape castigatoare
+
+Serverul raspunde cu o linie JSON care contine doar stivele modificate. Fiecare
+stiva modificata este `[keep, *cards]`: clientul pastreaza primele `keep` carti
+si adauga restul. Cartile sunt codificate ca "<valoare><initiala culorii>"
+(ex. "12h"), iar cartile cu fata in jos ca "?".
+"""
+
+from solitaire.game_logic import Card
+
+SUITS = {suit[0]: suit for suit in ["hearts", "diamonds", "spades", "clubs"]}
+HIDDEN = "?"
+
+
+def encode_card(card):
+    """Codifica o carte ca sir scurt."""
+    return f"{card.value}{card.suit[0]}"
+
+
+def decode_card(code):
+    """Decodifica o carte; cartile ascunse devin o carte fara valoare."""
+    if code == HIDDEN:
+        return Card(0, "hidden")
+    return Card(int(code[:-1]), SUITS[code[-1]])
+
+
+def snapshot(game):
+    """Returneaza starea vizibila a jocului, stiva cu stiva. Cartile cu fata in jos sunt ascunse."""
+    state = {
+        "s": [HIDDEN] * len(game.stock.cards),
+        "w": [encode_card(card) for card in game.waste.cards],
+        "fs": [foundation.suit for foundation in game.foundation],
+    }
+    for i, tableau in enumerate(game.tableau):
+        hidden_count = len(tableau.cards) - tableau.face_up_cards
+        state[f"t{i}"] = [HIDDEN] * hidden_count + [
+            encode_card(card) for card in tableau.cards[hidden_count:]
+        ]
+    for i, foundation in enumerate(game.foundation):
+        state[f"f{i}"] = [encode_card(card) for card in foundation.cards]
+    return state
+
+
+def diff(old, new):
+    """Calculeaza diferentele dintre doua stari. Stivele disparute sunt marcate cu None."""
+    delta = {}
+    for key, cards in new.items():
+        previous = old.get(key)
+        if previous == cards:
+            continue
+        if key == "fs":
+            delta[key] = cards
+            continue
+        previous = previous or []
+        keep = 0
+        limit = min(len(previous), len(cards))
+        while keep < limit and previous[keep] == cards[keep]:
+            keep += 1
+        delta[key] = [keep] + cards[keep:]
+    for key in old:
+        if key not in new:
+            delta[key] = None
+    return delta
+
+
+def apply_delta(state, delta):
+    """Aplica o diferenta primita de la server peste starea locala."""
+    for key, change in delta.items():
+        if change is None:
+            state.pop(key, None)
+        elif key == "fs":
+            state[key] = change
+        else:
+            keep = change[0]
+            state[key] = state.get(key, [])[:keep] + change[1:]
+    return state
+
+
+def tableau_index(game, value):
+    """Valideaza indexul unei stive Tableau primit de la client."""
+    index = int(value)
+    if not 0 <= index < len(game.tableau):
+        raise ValueError(f"Invalid tableau index {value}")
+    return index
+
+
+def apply_move(game, move):
+    """Valideaza si executa o mutare compacta pe motorul jocului."""
+    if move == "d":
+        game.draw_from_stock()
+    elif move == "r":
+        game.recycle_stock()
+    elif move == "wf":
+        game.move_from_waste_to_foundation()
+    elif move == "sf":
+        game.move_from_stock_to_foundation()
+    elif move == "aw":
+        game.setup_almost_win_state()
+    elif move[:2] == "wt":
+        game.move_from_waste_to_tableau(tableau_index(game, move[2:]))
+    elif move[:2] == "st":
+        game.move_from_stock_to_tableau(tableau_index(game, move[2:]))
+    elif move[:2] == "tf":
+        if not game.move_to_foundation(tableau_index(game, move[2:])):
+            raise ValueError("Cannot move card to any Foundation")
+    elif move[:2] == "tt":
+        args = move[2:].split(",")
+        if len(args) != 3:
+            raise ValueError(f"Invalid move {move}")
+        from_index = tableau_index(game, args[0])
+        to_index = tableau_index(game, args[1])
+        start = int(args[2])
+        if not 0 <= start < len(game.tableau[from_index].cards):
+            raise ValueError(f"Invalid card index {args[2]}")
+        game.move_within_tableau(from_index, to_index, start)
+    else:
+        raise ValueError(f"Unknown move {move}")
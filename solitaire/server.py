@@ -0,0 +1,334 @@
+"""Server asyncio care gazduieste multe jocuri Solitaire simultan.
+
+Porneste cu:
+  python -m solitaire.server --port 8765
+  python -m solitaire.server --unix /tmp/solitaire.sock
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import pickle
+import secrets
+import string
+import time
+from collections import OrderedDict
+
+from solitaire.game_logic import Solitaire
+from solitaire.protocol import apply_move, diff, snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class Session:
+    def __init__(self, session_id, game):
+        self.session_id = session_id
+        self.game = game
+        self.clients = 0
+        self.evicting = False
+        self.last_used = time.monotonic()
+
+    def touch(self):
+        """Marcheaza sesiunea ca fiind folosita acum."""
+        self.last_used = time.monotonic()
+
+
+def write_spooled(path, data):
+    """Scrie atomic o sesiune serializata pe disc."""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        remove_spooled(tmp_path)
+        raise
+
+
+def read_spooled(path):
+    """Citeste si sterge o sesiune salvata pe disc."""
+    with open(path, "rb") as f:
+        data = f.read()
+    os.remove(path)
+    return data
+
+
+def remove_spooled(path):
+    """Sterge o sesiune salvata pe disc, daca exista."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def expire_spooled(spool_dir, max_age):
+    """Sterge sesiunile salvate pe disc mai vechi de `max_age` secunde. Returneaza numarul lor."""
+    deadline = time.time() - max_age
+    expired = 0
+    for entry in os.scandir(spool_dir):
+        if entry.name.endswith(".pickle") and entry.stat().st_mtime < deadline:
+            remove_spooled(entry.path)
+            expired += 1
+    return expired
+
+
+class SessionStore:
+    """Tine sesiunile in memorie si le muta pe disc pe cele inactive.
+
+    Cand numarul de sesiuni din memorie depaseste `max_resident`, sesiunile fara
+    clienti conectati sunt scrise pe disc in fundal, incepand cu cele folosite cel
+    mai demult. Daca scrierea esueaza, sesiunea ramane in memorie.
+    Sesiunile de pe disc nefolosite de `retention` secunde sunt sterse. Citirile si
+    scrierile pe disc ruleaza in thread-uri separate pentru a nu bloca bucla asyncio.
+    """
+
+    def __init__(self, spool_dir, max_resident=10000, idle_timeout=600, retention=7 * 24 * 3600):
+        self.spool_dir = spool_dir
+        self.max_resident = max_resident
+        self.idle_timeout = idle_timeout
+        self.retention = retention
+        self.sessions = OrderedDict()
+        self.eviction_task = None
+        os.makedirs(spool_dir, exist_ok=True)
+
+    def session_path(self, session_id):
+        """Returneaza calea fisierului in care este salvata o sesiune."""
+        if not session_id or not all(c in string.hexdigits for c in session_id):
+            raise ValueError(f"Invalid session id {session_id}")
+        return os.path.join(self.spool_dir, f"{session_id}.pickle")
+
+    def create(self):
+        """Creeaza o sesiune noua cu un joc proaspat."""
+        session = Session(secrets.token_hex(8), Solitaire())
+        self.sessions[session.session_id] = session
+        return self.acquire(session)
+
+    async def get(self, session_id):
+        """Returneaza o sesiune existenta, incarcand-o de pe disc daca a fost evacuata."""
+        session = self.sessions.get(session_id)
+        if session is None:
+            path = self.session_path(session_id)
+            try:
+                data = await asyncio.to_thread(read_spooled, path)
+            except FileNotFoundError:
+                data = None
+            # Un alt client poate sa fi incarcat sesiunea in timp ce asteptam citirea.
+            session = self.sessions.get(session_id)
+            if session is None:
+                if data is None:
+                    raise ValueError(f"Unknown session {session_id}")
+                try:
+                    game = pickle.loads(data)
+                except Exception as e:
+                    raise ValueError(f"Corrupt session {session_id}") from e
+                session = Session(session_id, game)
+                self.sessions[session_id] = session
+        return self.acquire(session)
+
+    def touch(self, session):
+        """Marcheaza sesiunea ca fiind cea mai recent folosita."""
+        session.touch()
+        if session.session_id in self.sessions:
+            self.sessions.move_to_end(session.session_id)
+
+    def acquire(self, session):
+        """Ataseaza un client la sesiune si porneste evacuarea daca limita de memorie este depasita."""
+        session.clients += 1
+        self.touch(session)
+        self.schedule_eviction()
+        return session
+
+    def schedule_eviction(self):
+        """Porneste in fundal evacuarea sesiunilor peste limita, daca nu ruleaza deja."""
+        if len(self.sessions) <= self.max_resident:
+            return
+        if self.eviction_task is None or self.eviction_task.done():
+            self.eviction_task = asyncio.get_running_loop().create_task(self.evict_over_limit())
+
+    def release(self, session):
+        """Detaseaza un client de la sesiune."""
+        session.clients -= 1
+        self.touch(session)
+
+    def discard(self, session):
+        """Renunta la o sesiune inlocuita de un joc nou, daca nu mai are clienti."""
+        if session.clients == 0:
+            self.sessions.pop(session.session_id, None)
+
+    async def evict(self, session, force=False):
+        """Scrie o sesiune pe disc si o elimina din memorie.
+
+        Daca sesiunea este folosita in timpul scrierii, ramane in memorie si fisierul
+        este sters. Cu `force` sesiunea este scrisa chiar daca are clienti conectati.
+        """
+        if session.evicting:
+            return
+        session.evicting = True
+        try:
+            last_used = session.last_used
+            path = self.session_path(session.session_id)
+            data = pickle.dumps(session.game)
+            await asyncio.to_thread(write_spooled, path, data)
+            if force or (session.clients == 0 and session.last_used == last_used):
+                self.sessions.pop(session.session_id, None)
+            else:
+                await asyncio.to_thread(remove_spooled, path)
+        finally:
+            session.evicting = False
+
+    async def evict_over_limit(self):
+        """Evacueaza sesiunile inactive cele mai vechi pana cand limita de memorie este respectata."""
+        for session in list(self.sessions.values()):
+            if len(self.sessions) <= self.max_resident:
+                break
+            if session.clients == 0 and not session.evicting:
+                try:
+                    await self.evict(session)
+                except OSError as e:
+                    logger.warning("Cannot spool session %s: %s", session.session_id, e)
+                    break
+
+    async def evict_idle(self):
+        """Evacueaza sesiunile fara clienti care nu au fost folosite de `idle_timeout` secunde."""
+        deadline = time.monotonic() - self.idle_timeout
+        for session in list(self.sessions.values()):
+            if session.last_used > deadline:
+                break
+            if session.clients == 0:
+                try:
+                    await self.evict(session)
+                except OSError as e:
+                    logger.warning("Cannot spool session %s: %s", session.session_id, e)
+                    break
+
+    async def expire_spooled(self):
+        """Sterge sesiunile salvate pe disc mai vechi decat perioada de retentie."""
+        return await asyncio.to_thread(expire_spooled, self.spool_dir, self.retention)
+
+    async def flush(self):
+        """Scrie pe disc toate sesiunile din memorie (la oprirea serverului)."""
+        for session in list(self.sessions.values()):
+            try:
+                await self.evict(session, force=True)
+            except OSError as e:
+                logger.error("Cannot spool session %s: %s", session.session_id, e)
+
+
+class GameServer:
+    def __init__(self, store):
+        self.store = store
+        self.writers = set()
+
+    async def handle_command(self, session, command):
+        """Executa o comanda si returneaza sesiunea activa dupa ea."""
+        if command == "new" or command.startswith("join "):
+            if command == "new":
+                joined = self.store.create()
+            else:
+                joined = await self.store.get(command[5:].strip())
+            if session is not None:
+                self.store.release(session)
+                if command == "new":
+                    self.store.discard(session)
+            return joined
+        if session is None:
+            raise ValueError("No active session")
+        self.store.touch(session)
+        apply_move(session.game, command)
+        return session
+
+    async def handle_client(self, reader, writer):
+        """Proceseaza comenzile unui client. Fiecare raspuns contine doar stivele modificate."""
+        session = None
+        view = {}
+        self.writers.add(writer)
+        try:
+            while True:
+                response = {"ok": True}
+                try:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    command = line.decode().strip()
+                    if not command:
+                        continue
+                    session = await self.handle_command(session, command)
+                    if command == "new" or command.startswith("join "):
+                        view = {}
+                        response["session"] = session.session_id
+                except ValueError as e:
+                    # Include liniile invalide UTF-8 si cele mai lungi decat limita StreamReader.
+                    response = {"ok": False, "error": str(e)}
+                if session is not None:
+                    state = snapshot(session.game)
+                    response["d"] = diff(view, state)
+                    response["won"] = session.game.check_win()
+                    view = state
+                writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if session is not None:
+                self.store.release(session)
+            self.writers.discard(writer)
+            writer.close()
+
+    async def maintain_periodically(self, interval=30):
+        """Muta periodic sesiunile inactive pe disc si sterge sesiunile expirate."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.store.evict_idle()
+                await self.store.expire_spooled()
+            except Exception:
+                logger.exception("Session maintenance failed")
+
+    async def serve(self, host="127.0.0.1", port=8765, unix_path=None):
+        """Porneste serverul pe TCP sau pe un socket Unix si ruleaza pana la oprire."""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+        print(f"Serving on {unix_path or f'{host}:{port}'}")
+        maintenance = asyncio.create_task(self.maintain_periodically())
+        async with server:
+            try:
+                await server.serve_forever()
+            finally:
+                tasks = [maintenance]
+                if self.store.eviction_task is not None:
+                    tasks.append(self.store.eviction_task)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                for writer in list(self.writers):
+                    writer.close()
+                await self.store.flush()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solitaire game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--spool-dir", default="sessions")
+    parser.add_argument("--max-sessions", type=int, default=10000)
+    parser.add_argument("--idle-timeout", type=float, default=600)
+    parser.add_argument(
+        "--retention", type=float, default=7 * 24 * 3600, help="seconds to keep spooled sessions"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    store = SessionStore(args.spool_dir, args.max_sessions, args.idle_timeout, args.retention)
+    try:
+        asyncio.run(GameServer(store).serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
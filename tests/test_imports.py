@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+import unittest
+
+
+class ImportTest(unittest.TestCase):
+    def test_engine_import_does_not_load_gui_modules(self):
+        code = (
+            "import sys, solitaire\n"
+            "print(' '.join(m for m in sys.modules"
+            " if m.split('.')[0] in ('tkinter', '_tkinter', 'PIL')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "")
+        self.assertEqual(result.stderr, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import atexit
+import json
+import os
+import tempfile
+import unittest
+
+from solitaire.profiling import Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.profiler = Profiler()
+        self.addCleanup(atexit.unregister, self.profiler.export)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_configure_from_env_disabled_by_default(self):
+        self.profiler.configure_from_env({})
+        self.assertFalse(self.profiler.enabled)
+
+    def test_configure_from_env_modes(self):
+        self.profiler.configure_from_env(
+            {"SOLITAIRE_PROFILE": "1", "SOLITAIRE_PROFILE_FILE": self.path("stats.prom")}
+        )
+        self.assertTrue(self.profiler.enabled)
+        self.assertEqual(self.profiler.sample_every, 1)
+        self.assertEqual(self.profiler.output_path, self.path("stats.prom"))
+
+        self.profiler.configure_from_env(
+            {"SOLITAIRE_PROFILE": "sample", "SOLITAIRE_PROFILE_SAMPLE": "4"}
+        )
+        self.assertEqual(self.profiler.sample_every, 4)
+
+    def test_configure_from_env_invalid_sample_falls_back(self):
+        for value in ["abc", "0"]:
+            with self.subTest(value=value):
+                with self.assertLogs("solitaire.profiling", "WARNING"):
+                    self.profiler.configure_from_env(
+                        {"SOLITAIRE_PROFILE": "sample", "SOLITAIRE_PROFILE_SAMPLE": value}
+                    )
+                self.assertEqual(self.profiler.sample_every, 10)
+
+    def test_sampling_times_every_nth_call(self):
+        self.profiler.enable(sample_every=3)
+        for _ in range(7):
+            self.profiler.call("f", lambda: None, (), {})
+        stats = self.profiler.snapshot()["stats"]["f"]
+        self.assertEqual(stats["calls"], 7)
+        self.assertEqual(stats["sampled_calls"], 2)
+
+    def test_snapshot_mean(self):
+        self.profiler.add_timing("f", 1.0)
+        self.profiler.add_timing("f", 3.0)
+        self.profiler.calls["f"] = 2
+        stats = self.profiler.snapshot()["stats"]["f"]
+        self.assertEqual(stats["total_seconds"], 4.0)
+        self.assertEqual(stats["mean_seconds"], 2.0)
+        self.assertEqual(stats["max_seconds"], 3.0)
+
+    def test_to_prometheus(self):
+        self.profiler.calls["f"] = 1
+        self.profiler.add_timing("f", 0.5)
+        lines = self.profiler.to_prometheus().splitlines()
+        self.assertIn("# TYPE solitaire_calls_total counter", lines)
+        self.assertIn('solitaire_calls_total{name="f"} 1', lines)
+        self.assertIn('solitaire_seconds_total{name="f"} 0.5', lines)
+        self.assertIn("# TYPE solitaire_seconds_max gauge", lines)
+
+    def test_export_format_follows_extension(self):
+        self.profiler.calls["f"] = 1
+        self.profiler.add_timing("f", 0.5)
+
+        path = self.profiler.export(self.path("stats.json"))
+        with open(path) as f:
+            self.assertEqual(json.load(f)["stats"]["f"]["calls"], 1)
+
+        path = self.profiler.export(self.path("stats.prom"))
+        with open(path) as f:
+            self.assertTrue(f.read().startswith("# HELP solitaire_calls_total"))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ["stats.json", "stats.prom"])
+
+
+if __name__ == "__main__":
+    unittest.main()
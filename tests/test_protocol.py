@@ -0,0 +1,61 @@
+import unittest
+
+from solitaire.game_logic import Card, Solitaire
+from solitaire.protocol import apply_delta, apply_move, diff, snapshot
+
+
+class ProtocolTest(unittest.TestCase):
+    def test_full_state_round_trip(self):
+        game = Solitaire()
+        state = snapshot(game)
+        self.assertEqual(apply_delta({}, diff({}, state)), state)
+        self.assertEqual(state["s"], ["?"] * 24)
+        self.assertEqual(state["t6"][:6], ["?"] * 6)
+
+    def test_delta_reveals_hidden_card(self):
+        game = Solitaire()
+        tableau = game.tableau[1]
+        hidden, top = tableau.cards
+        old = snapshot(game)
+
+        tableau.remove_card()
+        new = snapshot(game)
+        delta = diff(old, new)
+
+        self.assertEqual(delta, {"t1": [0, f"{hidden.value}{hidden.suit[0]}"]})
+        self.assertEqual(apply_delta(dict(old), delta), new)
+
+    def test_delta_only_contains_changed_piles(self):
+        game = Solitaire()
+        old = snapshot(game)
+        card = game.draw_from_stock()
+        delta = diff(old, snapshot(game))
+        self.assertEqual(delta, {"s": [23], "w": [0, f"{card.value}{card.suit[0]}"]})
+
+    def test_delta_marks_removed_piles(self):
+        game = Solitaire()
+        old = snapshot(game)
+        game.setup_almost_win_state()
+        new = snapshot(game)
+        delta = diff(old, new)
+        self.assertIsNone(delta["t6"])
+        self.assertEqual(apply_delta(dict(old), delta), new)
+
+    def test_apply_move_rejects_invalid_moves(self):
+        game = Solitaire()
+        for move in ["wt7", "wt-1", "st", "tfx", "tt0,1", "tt0,1,9", "tt0,9,0", "zz"]:
+            with self.subTest(move=move):
+                with self.assertRaises(ValueError):
+                    apply_move(game, move)
+
+    def test_apply_move_validates_with_engine(self):
+        game = Solitaire()
+        game.waste.add_card(Card(2, "hearts"))
+        with self.assertRaises(ValueError):
+            apply_move(game, "wf")
+        apply_move(game, "d")
+        self.assertEqual(len(game.waste.cards), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
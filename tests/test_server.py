@@ -0,0 +1,196 @@
+import asyncio
+import errno
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from solitaire.client import Connection, RemoteSolitaire
+from solitaire.protocol import apply_delta
+from solitaire.server import GameServer, SessionStore
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.spool_dir = os.path.join(self.tmp.name, "spool")
+        self.socket_path = os.path.join(self.tmp.name, "server.sock")
+        self.store = SessionStore(self.spool_dir, max_resident=1)
+        self.server = await asyncio.start_unix_server(
+            GameServer(self.store).handle_client, path=self.socket_path
+        )
+
+    async def asyncTearDown(self):
+        if self.store.eviction_task is not None:
+            await self.store.eviction_task
+        self.server.close()
+        await self.server.wait_closed()
+        self.tmp.cleanup()
+
+    async def connect(self):
+        reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        self.addAsyncCleanup(self.close, writer)
+        return reader, writer
+
+    async def close(self, writer):
+        writer.close()
+        await writer.wait_closed()
+
+    async def send(self, reader, writer, line):
+        writer.write(line if isinstance(line, bytes) else line.encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    async def test_new_game_and_move(self):
+        reader, writer = await self.connect()
+        response = await self.send(reader, writer, "new")
+        self.assertTrue(response["ok"])
+        state = apply_delta({}, response["d"])
+        self.assertEqual(len(state["s"]), 24)
+
+        response = await self.send(reader, writer, "d")
+        self.assertTrue(response["ok"])
+        self.assertEqual(set(response["d"]), {"s", "w"})
+        apply_delta(state, response["d"])
+        self.assertEqual(len(state["s"]), 23)
+        self.assertEqual(len(state["w"]), 1)
+
+    async def test_join_reloads_evicted_session(self):
+        reader, writer = await self.connect()
+        first = await self.send(reader, writer, "new")
+        await self.send(reader, writer, "d")
+        await self.close(writer)
+        await asyncio.sleep(0.05)
+
+        other_reader, other_writer = await self.connect()
+        await self.send(other_reader, other_writer, "new")
+        await self.store.eviction_task
+        session_id = first["session"]
+        self.assertNotIn(session_id, self.store.sessions)
+        self.assertTrue(os.path.exists(self.store.session_path(session_id)))
+
+        reader, writer = await self.connect()
+        response = await self.send(reader, writer, f"join {session_id}")
+        self.assertTrue(response["ok"])
+        state = apply_delta({}, response["d"])
+        self.assertEqual(len(state["s"]), 23)
+        self.assertIn(session_id, self.store.sessions)
+        self.assertFalse(os.path.exists(self.store.session_path(session_id)))
+
+    async def test_new_discards_replaced_session(self):
+        reader, writer = await self.connect()
+        first = await self.send(reader, writer, "new")
+        await self.send(reader, writer, "new")
+        self.assertNotIn(first["session"], self.store.sessions)
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    async def test_malformed_input_keeps_connection(self):
+        reader, writer = await self.connect()
+        await self.send(reader, writer, "new")
+        for line in [b"\xff\n", b"x" * 70000 + b"\n", b"zz\n", b"join ../etc\n"]:
+            response = await self.send(reader, writer, line)
+            self.assertFalse(response["ok"])
+        response = await self.send(reader, writer, "d")
+        self.assertTrue(response["ok"])
+
+    async def test_corrupt_spooled_session(self):
+        with open(self.store.session_path("abcd"), "wb") as f:
+            f.write(b"not a pickle")
+        reader, writer = await self.connect()
+        response = await self.send(reader, writer, "join abcd")
+        self.assertFalse(response["ok"])
+        self.assertIn("Corrupt session", response["error"])
+
+    async def test_flush_and_expire_spooled_sessions(self):
+        reader, writer = await self.connect()
+        response = await self.send(reader, writer, "new")
+        await self.store.flush()
+        self.assertEqual(self.store.sessions, {})
+        self.assertTrue(os.path.exists(self.store.session_path(response["session"])))
+
+        self.store.retention = -1
+        self.assertEqual(await self.store.expire_spooled(), 1)
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+    async def test_failed_spool_write_keeps_session_resident(self):
+        reader, writer = await self.connect()
+        first = await self.send(reader, writer, "new")
+        await self.close(writer)
+        await asyncio.sleep(0.05)
+
+        disk_full = OSError(errno.ENOSPC, "No space left on device")
+        with mock.patch("solitaire.server.os.replace", side_effect=disk_full):
+            reader, writer = await self.connect()
+            with self.assertLogs("solitaire.server", "WARNING"):
+                response = await self.send(reader, writer, "new")
+                await self.store.eviction_task
+        self.assertTrue(response["ok"])
+        self.assertIn(first["session"], self.store.sessions)
+        self.assertEqual(self.store.sessions[response["session"]].clients, 1)
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+        response = await self.send(reader, writer, "d")
+        self.assertTrue(response["ok"])
+
+    async def test_maintenance_survives_errors(self):
+        calls = []
+
+        async def evict_idle():
+            calls.append(None)
+            if len(calls) == 1:
+                raise OSError(errno.ENOSPC, "No space left on device")
+
+        self.store.evict_idle = evict_idle
+        maintenance = asyncio.create_task(GameServer(self.store).maintain_periodically(0))
+        with self.assertLogs("solitaire.server", "ERROR"):
+            while len(calls) < 3:
+                await asyncio.sleep(0.01)
+        maintenance.cancel()
+        await asyncio.gather(maintenance, return_exceptions=True)
+
+    async def test_remote_solitaire_plays_to_win(self):
+        def play():
+            connection = Connection(f"unix:{self.socket_path}")
+            try:
+                game = RemoteSolitaire(connection)
+                self.assertEqual(len(game.tableau), 7)
+                self.assertEqual(len(game.stock.cards), 24)
+
+                card = game.draw_from_stock()
+                self.assertEqual(len(game.stock.cards), 23)
+                self.assertEqual(game.waste.peek().value, card.value)
+
+                game.setup_almost_win_state()
+                self.assertEqual(len(game.tableau), 4)
+                for i in range(4):
+                    self.assertFalse(game.check_win())
+                    self.assertTrue(game.move_to_foundation(i))
+                self.assertTrue(game.check_win())
+                self.assertFalse(game.move_to_foundation(0))
+            finally:
+                connection.close()
+
+        await asyncio.to_thread(play)
+
+    async def test_connection_times_out_on_stalled_server(self):
+        async def stall(reader, writer):
+            await reader.read()
+
+        stalled_path = os.path.join(self.tmp.name, "stalled.sock")
+        stalled = await asyncio.start_unix_server(stall, path=stalled_path)
+        self.addAsyncCleanup(stalled.wait_closed)
+        self.addCleanup(stalled.close)
+
+        def send():
+            connection = Connection(f"unix:{stalled_path}", timeout=0.1)
+            with self.assertRaises(TimeoutError):
+                connection.send("new")
+            with self.assertRaises(OSError):
+                connection.send("new")
+
+        await asyncio.to_thread(send)
+
+
+if __name__ == "__main__":
+    unittest.main()